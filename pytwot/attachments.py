@@ -35,7 +35,7 @@ from .dataclass import Button, NonPublicMediaMetrics, Option, OrganicMediaMetric
 from .enums import ButtonType, MediaType
 from .errors import pytwotException
 from .objects import Comparable
-from .utils import convert, guess_mimetype, time_parse_todt
+from .utils import guess_mimetype, time_parse_todt
 
 if TYPE_CHECKING:
     from .http import HTTPClient
@@ -61,6 +61,7 @@ class Media:
         "_type",
         "_width",
         "_height",
+        "_view_count",
         "_public_metrics",
         "_non_public_metrics",
         "_organic_metrics",
@@ -70,15 +71,20 @@ class Media:
     def __init__(self, data: Dict[str, Any], *, http_client: HTTPClient):
         self.http_client = http_client
         self._payload = data
-        self._url = self._payload.get("url")
-        self._preview_image_url = self._payload.get("preview_image_url")
-        self._media_key = self._payload.get("media_key")
-        self._type = MediaType(self._payload.get("type"))
-        self._width, self._height = self._payload.get("width"), self._payload.get("height")
-        self._public_metrics = self._payload.get("public_metrics")
-        self._non_public_metrics = self._payload.get("non_public_metrics")
-        self._organic_metrics = self._payload.get("organic_metrics")
-        self._promoted_metrics = self._payload.get("promoted_metrics")
+        self._url = data.get("url")
+        self._preview_image_url = data.get("preview_image_url")
+        self._media_key = data.get("media_key")
+        self._type = MediaType(data.get("type"))
+        width = data.get("width")
+        self._width = int(width) if width is not None else None
+        height = data.get("height")
+        self._height = int(height) if height is not None else None
+        self._public_metrics = data.get("public_metrics")
+        view_count = self._public_metrics.get("view_count") if self._public_metrics else None
+        self._view_count = int(view_count) if view_count is not None else None
+        self._non_public_metrics = data.get("non_public_metrics")
+        self._organic_metrics = data.get("organic_metrics")
+        self._promoted_metrics = data.get("promoted_metrics")
 
         if self._non_public_metrics:
             non_public_metrics = self.http_client.payload_parser.parse_metric_data(self._non_public_metrics)
@@ -115,12 +121,12 @@ class Media:
     @property
     def width(self) -> Optional[int]:
         """Optional[:class:`int`]: Returns the image's width"""
-        return convert(self._width, int)
+        return self._width
 
     @property
     def height(self) -> Optional[int]:
         """Optional[:class:`int`]: Returns the image's height"""
-        return convert(self._height, int)
+        return self._height
 
     @property
     def view_count(self) -> Optional[int]:
@@ -128,9 +134,7 @@ class Media:
 
         .. versionadded:: 1.5.0
         """
-        if not self._public_metrics:
-            return None
-        return convert(self._public_metrics["view_count"], int)
+        return self._view_count
 
     @property
     def non_public_metrics(self) -> Optional[NonPublicMediaMetrics]:
@@ -192,6 +196,7 @@ class Poll(Comparable):
     __slots__ = (
         "_id",
         "_voting_status",
+        "_is_open",
         "_end_date",
         "_duration",
         "_options",
@@ -199,10 +204,13 @@ class Poll(Comparable):
     )
 
     def __init__(self, *, duration: int, **kwargs):
-        self._id: Optional[ID] = kwargs.get("id", None)
+        id = kwargs.get("id", None)
+        self._id: Optional[int] = int(id) if id else None
         self._voting_status: Optional[str] = kwargs.get("voting_status", None)
-        self._end_date = kwargs.get("end_date", None)
-        self._duration = duration
+        self._is_open: bool = self._voting_status == "open"
+        end_date = kwargs.get("end_date", None)
+        self._end_date: Optional[datetime.datetime] = time_parse_todt(end_date) if end_date else None
+        self._duration: Optional[int] = int(duration) if duration else None
         self._options = []
         self._raw_options = []
         super().__init__(self.id)
@@ -251,7 +259,7 @@ class Poll(Comparable):
 
         .. versionadded:: 1.1.0
         """
-        return int(self._id) if self._id else None
+        return self._id
 
     @property
     def options(self) -> List[PollOption]:
@@ -286,7 +294,7 @@ class Poll(Comparable):
         .. versionadded:: 1.3.7
         """
 
-        return self.voting_status == "open"
+        return self._is_open
 
     @property
     def is_closed(self) -> bool:
@@ -295,7 +303,7 @@ class Poll(Comparable):
         .. versionadded:: 1.3.7
         """
 
-        return not self.is_open
+        return not self._is_open
 
     @property
     def duration(self) -> int:
@@ -303,7 +311,7 @@ class Poll(Comparable):
 
         .. versionadded:: 1.3.5
         """
-        return int(self._duration) if self._duration else None
+        return self._duration
 
     @property
     def end_date(self) -> Optional[datetime.datetime]:
@@ -311,7 +319,7 @@ class Poll(Comparable):
 
         .. versionadded:: 1.1.0
         """
-        return time_parse_todt(self._end_date) if self._end_date else None
+        return self._end_date
 
 
 class QuickReply:
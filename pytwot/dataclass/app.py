@@ -38,3 +38,6 @@ class ApplicationInfo:
     name: str
     id: ID
     url: str
+
+    def __post_init__(self) -> None:
+        self.id = int(self.id)
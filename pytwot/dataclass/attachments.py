@@ -24,7 +24,7 @@ SOFTWARE.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 from ..enums import ButtonType
 
@@ -45,6 +45,14 @@ class Option:
 class PollOption:
     """Represents an Option for :class:`Poll`. You can add an option to a poll using :meth:`Poll.add_option`.
 
+    .. describe:: x < y, x <= y, x > y, x >= y
+
+        Compare two options by their position. Equality still compares every field.
+
+
+    .. note::
+        When sorting many options prefer ``sorted(poll.options, key=operator.attrgetter("position"))``, the key is computed once per option instead of calling ``__lt__`` on every comparison.
+
     .. versionadded:: 1.3.5
     """
 
@@ -52,6 +60,26 @@ class PollOption:
     position: int = 0
     votes: int = 0
 
+    def __lt__(self, other: Any) -> bool:
+        if not isinstance(other, PollOption):
+            return NotImplemented
+        return self.position < other.position
+
+    def __le__(self, other: Any) -> bool:
+        if not isinstance(other, PollOption):
+            return NotImplemented
+        return self.position <= other.position
+
+    def __gt__(self, other: Any) -> bool:
+        if not isinstance(other, PollOption):
+            return NotImplemented
+        return self.position > other.position
+
+    def __ge__(self, other: Any) -> bool:
+        if not isinstance(other, PollOption):
+            return NotImplemented
+        return self.position >= other.position
+
 
 @dataclass
 class Button:
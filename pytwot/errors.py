@@ -23,10 +23,13 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from __future__ import annotations
+
 from json import decoder
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import requests
+if TYPE_CHECKING:
+    import requests
 
 
 class pytwotException(Exception):
@@ -71,14 +74,17 @@ class HTTPException(pytwotException):
         message: str = None,
     ) -> None:
         self.response = response
+        self.status_code: Optional[int] = response.status_code if response is not None else None
         self.message = message
         self.detail = None
         if response is not None:
             try:
                 res = self.response.json()
-                if res.get("errors"):
-                    self.message = res.get("errors")[0].get("message") if not message else message
-                    self.detail = res.get("errors")[0].get("detail")
+                errors = res.get("errors")
+                if errors:
+                    error = errors[0]
+                    self.message = message or error.get("message")
+                    self.detail = error.get("detail")
 
                 else:
                     self.message = res.get("error")
@@ -87,12 +93,12 @@ class HTTPException(pytwotException):
 
             except decoder.JSONDecodeError:
                 super().__init__(
-                    f"Request returned an Exception (status code: {self.response.status_code}): {self.response.text}",
+                    f"Request returned an Exception (status code: {self.status_code}): {self.response.text}",
                 )
 
             else:
                 super().__init__(
-                    f"Request returned an Exception (status code: {self.response.status_code}): {self.message if self.message else self.detail}",
+                    f"Request returned an Exception (status code: {self.status_code}): {self.message if self.message else self.detail}",
                 )
 
         else:
@@ -100,12 +106,6 @@ class HTTPException(pytwotException):
                 f"Exception Raise: {self.message}",
             )
 
-    @property
-    def status_code(self) -> Optional[int]:
-        if not self.response:
-            return None
-        return self.response.status_code
-
 
 class BadRequests(HTTPException):
     """This class inherits :class:`HTTPException`. Raise when a request return status code: 400.
@@ -173,6 +173,17 @@ class Conflict(HTTPException):
     pass
 
 
+# Status codes that map directly to an HTTPException subclass, used by HTTPClient.request.
+_STATUS_CODE_EXCEPTIONS = {
+    400: BadRequests,
+    401: Unauthorized,
+    403: Forbidden,
+    404: NotFound,
+    409: Conflict,
+    431: FieldsTooLarge,
+}
+
+
 class UnKnownSpaceState(APIException):
     """This error class inherits :class:`APIException`. This error is Raise when a user specified an invalid space state.
 
@@ -24,6 +24,7 @@ SOFTWARE.
 """
 
 import datetime
+from itertools import islice
 from typing import Optional, Union
 
 from .enums import ActionEventType, UserActionEventType
@@ -32,6 +33,8 @@ from .type import Payload
 from .user import User
 from .utils import time_parse_todt
 
+_EVENT_TYPES = {**ActionEventType._value2member_map_, **UserActionEventType._value2member_map_}
+
 # Events type
 
 
@@ -41,11 +44,13 @@ class Event:
     .. versionadded:: 1.5.0
     """
 
-    __slots__ = ("_payload", "_type")
+    __slots__ = ("_payload", "_type", "_event_type", "_created_at")
 
     def __init__(self, data: Payload):
-        self._type = list(data.keys())[1]
-        self._payload = data.get(self._type)[0]
+        self._type = next(islice(data, 1, 2))
+        self._payload = data[self._type][0]
+        self._event_type = None
+        self._created_at = None
 
     @property
     def type(self) -> Union[UserActionEventType, ActionEventType]:
@@ -53,10 +58,12 @@ class Event:
 
         .. versionadded:: 1.5.0
         """
-        try:
-            return ActionEventType(self._type)
-        except ValueError:
-            return UserActionEventType(self._type)
+        if self._event_type is None:
+            try:
+                self._event_type = _EVENT_TYPES[self._type]
+            except KeyError:
+                raise ValueError(f"{self._type!r} is not a valid event type") from None
+        return self._event_type
 
     @property
     def payload(self) -> Payload:
@@ -73,13 +80,17 @@ class UserActionEvent(Event):
     .. versionadded:: 1.5.0
     """
 
+    __slots__ = ()
+
     @property
     def created_at(self) -> datetime.datetime:
         """:class:`datetime.datetime`: Returns a datetime.datetime object with the action's created timestamp.
 
         .. versionadded:: 1.5.0
         """
-        return datetime.datetime.fromtimestamp(int(self.payload.get("created_timestamp")) / 1000)
+        if self._created_at is None:
+            self._created_at = datetime.datetime.fromtimestamp(int(self.payload.get("created_timestamp")) / 1000)
+        return self._created_at
 
     @property
     def target(self) -> User:
@@ -107,6 +118,8 @@ class UserActionEvent(Event):
 
 
 class DirectMessageEvent(Event):
+    __slots__ = ("http_client",)
+
     def __init__(self, data: Payload, *, http_client: object):
         super().__init__(data)
         self.http_client = http_client
@@ -117,7 +130,9 @@ class DirectMessageEvent(Event):
 
         .. versionadded:: 1.5.0
         """
-        return datetime.datetime.fromtimestamp(int(self.payload.get("created_at") / 1000))
+        if self._created_at is None:
+            self._created_at = datetime.datetime.fromtimestamp(int(self.payload["created_timestamp"]) / 1000)
+        return self._created_at
 
     @property
     def recipient(self) -> User:
@@ -125,7 +140,8 @@ class DirectMessageEvent(Event):
 
         .. versionadded:: 1.5.0
         """
-        return self.payload.get("target", {}).get("recipient")
+        target = self._payload.get("target")
+        return target.get("recipient") if target is not None else None
 
     @property
     def sender(self) -> User:
@@ -133,7 +149,8 @@ class DirectMessageEvent(Event):
 
         .. versionadded:: 1.5.0
         """
-        return self.payload.get("target", {}).get("sender", None)
+        target = self._payload.get("target")
+        return target.get("sender") if target is not None else None
 
 
 # Events
@@ -145,6 +162,8 @@ class DirectMessageTypingEvent(DirectMessageEvent):
     .. versionadded:: 1.5.0
     """
 
+    __slots__ = ()
+
     @property
     def typer(self) -> User:
         """:class:`User`: An alias to :meth:`DirectMessageEvent.sender`.
@@ -160,6 +179,8 @@ class DirectMessageReadEvent(DirectMessageEvent):
     .. versionadded:: 1.5.0
     """
 
+    __slots__ = ()
+
     @property
     def reader(self) -> Optional[User]:
         """:class:`User`: An alias to :meth:`DirectMessageEvent.sender`.
@@ -187,6 +208,8 @@ class TweetFavoriteActionEvent(Event):
     .. versionadded:: 1.5.0
     """
 
+    __slots__ = ()
+
     @property
     def id(self) -> str:
         """:class:`str`: Returns the action's unique ID.
@@ -201,7 +224,9 @@ class TweetFavoriteActionEvent(Event):
 
         .. versionadded:: 1.5.0
         """
-        return datetime.datetime.fromtimestamp(int(self.payload.get("timestamp_ms")) / 1000)
+        if self._created_at is None:
+            self._created_at = datetime.datetime.fromtimestamp(int(self.payload.get("timestamp_ms")) / 1000)
+        return self._created_at
 
     @property
     def favorited_tweet(self) -> Tweet:
@@ -226,6 +251,8 @@ class UserRevokeEvent(Event):
     .. versionadded:: 1.5.0
     """
 
+    __slots__ = ()
+
     def __init__(self, data: Payload):
         super().__init__(data.get("revoke"))
 
@@ -260,6 +287,8 @@ class UserFollowActionEvent(UserActionEvent):
     .. versionadded:: 1.5.0
     """
 
+    __slots__ = ()
+
     @property
     def follower(self) -> User:
         """:class:`User`: An alias to :meth:`UserActionEvent.source`. The user who followed/unfollowed the target.
@@ -275,6 +304,8 @@ class UserBlockActionEvent(UserActionEvent):
     .. versionadded:: 1.5.0
     """
 
+    __slots__ = ()
+
     @property
     def blocker(self) -> User:
         """:class:`User`: An alias to :meth:`UserActionEvent.source`. The user who blocked/unblocked the target.
@@ -290,6 +321,8 @@ class UserMuteActionEvent(UserActionEvent):
     .. versionadded:: 1.5.0
     """
 
+    __slots__ = ()
+
     @property
     def muter(self) -> User:
         """:class:`User`: An alias to :meth:`UserActionEvent.source`. The user who muted/unmuted the target.
@@ -305,7 +338,7 @@ class UserUnfollowActionEvent(UserFollowActionEvent):
     .. versionadded:: 1.5.0
     """
 
-    ...
+    __slots__ = ()
 
 
 class UserUnblockActionEvent(UserBlockActionEvent):
@@ -314,7 +347,7 @@ class UserUnblockActionEvent(UserBlockActionEvent):
     .. versionadded:: 1.5.0
     """
 
-    ...
+    __slots__ = ()
 
 
 class UserUnmuteActionEvent(UserMuteActionEvent):
@@ -323,4 +356,4 @@ class UserUnmuteActionEvent(UserMuteActionEvent):
     .. versionadded:: 1.5.0
     """
 
-    ...
+    __slots__ = ()
@@ -57,12 +57,9 @@ from .constants import (
 )
 from .enums import Granularity, JobStatus, JobType, ReplySetting, SpaceState
 from .errors import (
+    _STATUS_CODE_EXCEPTIONS,
     BadRequests,
-    Conflict,
     DisallowedResource,
-    FieldsTooLarge,
-    Forbidden,
-    NotFound,
     ResourceNotFound,
     TooManyRequests,
     Unauthorized,
@@ -272,20 +269,8 @@ class HTTPClient:
                     return response.text
                 return res
 
-            elif code == 400:
-                raise BadRequests(response)
-
-            elif code == 401:
-                raise Unauthorized(response)
-
-            elif code == 403:
-                raise Forbidden(response)
-
-            elif code == 404:
-                raise NotFound(response)
-
-            elif code == 409:
-                raise Conflict(response)
+            elif code in _STATUS_CODE_EXCEPTIONS:
+                raise _STATUS_CODE_EXCEPTIONS[code](response)
 
             elif code in (420, 429):  # 420 status code is an unofficial extension by Twitter.
                 if not self.handle_ratelimits:
@@ -307,9 +292,6 @@ class HTTPClient:
                     auth=auth,
                 )
 
-            elif code == 431:
-                raise FieldsTooLarge(response)
-
             if not is_json:
                 return response.text
 
@@ -25,7 +25,8 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Tuple
 
 from .errors import NoPageAvailable
 
@@ -33,6 +34,8 @@ if TYPE_CHECKING:
     from .http import HTTPClient
     from .type import Payload
 
+_get_id = attrgetter("id")
+
 
 class Pagination:
     """Represents the base class of all pagination objects.
@@ -42,8 +45,9 @@ class Pagination:
     """
 
     __slots__ = (
-        "__original_payload",
+        "_original_payload",
         "_payload",
+        "_content",
         "_meta",
         "_next_token",
         "_previous_token",
@@ -66,37 +70,43 @@ class Pagination:
         http_client: HTTPClient,
         **kwargs: Any,
     ) -> None:
-        self.__original_payload = data
-        self._payload = self.__original_payload.get("data")
-        self._meta = self.__original_payload.get("meta")
-        self._next_token = self._meta.get("next_token")
-        self._previous_token = self._meta.get("previous_token")
-        self._count = 0
+        self._apply_response(data)
         self._paginate_over = 0
         self._current_page_number = 1
         self._params = kwargs.get("params", None)
         self.item_type = item_type
         self.endpoint_request = endpoint_request
         self.http_client = http_client
-        self.pages_cache = {1: {obj.id: obj for obj in self.content}}
+        content = self.content
+        self.pages_cache = {1: dict(zip(map(_get_id, content), content))}
 
     @property
     def original_payload(self) -> Payload:
-        return self.__original_payload
+        return self._original_payload
 
     @original_payload.setter
-    def original_payload(self, other: dict) -> Payload:
-        self.__original_payload = other
-        return self.original_payload
+    def original_payload(self, other: dict) -> None:
+        self._original_payload = other
+        self._content = None
 
     @property
     def payload(self) -> dict:
         return self._payload
 
     @payload.setter
-    def payload(self, other: dict) -> dict:
+    def payload(self, other: dict) -> None:
         self._payload = other
-        return self._payload
+        self._content = None
+
+    def _apply_response(self, res: Payload) -> None:
+        meta = res.get("meta")
+        self._original_payload = res
+        self._payload = res.get("data")
+        self._content = None
+        self._meta = meta
+        self._next_token = meta.get("next_token")
+        self._previous_token = meta.get("previous_token")
+        self._count = 0
 
     @property
     def content(self) -> list:
@@ -104,6 +114,11 @@ class Pagination:
 
         .. versionadded:: 1.5.0
         """
+        if self._content is None:
+            self._content = self._parse_content()
+        return self._content
+
+    def _parse_content(self) -> list:
         return [self.item_type(data, http_client=self.http_client) for data in self.payload]
 
     @property
@@ -123,8 +138,8 @@ class Pagination:
         return self._current_page_number
 
     @property
-    def pages(self) -> List[Tuple[int, list]]:
-        """List[Tuple[:class:`int`, :class:`list`]]: Returns the zipped pages with the page number and content from a cache. If you never been into the page you want, it might not be returns in this property. example to use:
+    def pages(self) -> Iterator[Tuple[int, list]]:
+        """Iterator[Tuple[:class:`int`, :class:`list`]]: Returns the zipped pages with the page number and content from a cache. If you never been into the page you want, it might not be returns in this property. example to use:
 
         .. code-block:: py
 
@@ -134,10 +149,7 @@ class Pagination:
 
         .. versionadded:: 1.5.0
         """
-        fulldata = []
-        for page_number in self.pages_cache.keys():
-            fulldata.append(list(self.pages_cache.get(page_number).values()))
-        return zip(range(1, len(self.pages_cache) + 1), fulldata)
+        return ((page_number, list(content.values())) for page_number, content in self.pages_cache.items())
 
     def get_page_content(self, page_number: int) -> Optional[list]:
         """Gets the page `content` from the pagination pages cache. If you never been into the page you want, it might not be returns.
@@ -210,17 +222,13 @@ class UserPagination(Pagination):
         if not res:
             raise NoPageAvailable()
 
-        previous_content = self.content
+        previous_first_id = self._payload[0]["id"]
         self._current_page_number += 1
-        self.original_payload = res
-        self.payload = self.original_payload.get("data")
-        self._meta = self.original_payload.get("meta")
-        self._next_token = self._meta.get("next_token")
-        self._previous_token = self._meta.get("previous_token")
-        self._count = 0
+        self._apply_response(res)
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {user.id: user for user in self.content}
+        if previous_first_id != self._payload[0]["id"]:
+            new_content = self.content
+            self.pages_cache[self._current_page_number] = dict(zip(map(_get_id, new_content), new_content))
 
     def previous_page(self) -> None:
         """Change `content` property to the previous page's contents..
@@ -247,17 +255,13 @@ class UserPagination(Pagination):
         if not res:
             raise NoPageAvailable()
 
-        previous_content = self.content
+        previous_first_id = self._payload[0]["id"]
         self._current_page_number -= 1
-        self.original_payload = res
-        self.payload = self.original_payload.get("data")
-        self._meta = self.original_payload.get("meta")
-        self._next_token = self._meta.get("next_token")
-        self._previous_token = self._meta.get("previous_token")
-        self._count = 0
+        self._apply_response(res)
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {user.id: user for user in self.content}
+        if previous_first_id != self._payload[0]["id"]:
+            new_content = self.content
+            self.pages_cache[self._current_page_number] = dict(zip(map(_get_id, new_content), new_content))
 
 
 class TweetPagination(Pagination):
@@ -276,13 +280,7 @@ class TweetPagination(Pagination):
 
         super().__init__(data, item_type=Tweet, **kwargs)
 
-    @property
-    def content(self) -> list:
-        """:class:`list`: Returns a list of objects from the current page's content.
-
-        .. versionadded:: 1.5.0
-        """
-
+    def _parse_content(self) -> list:
         return [
             self.item_type(data, http_client=self.http_client)
             for data in self.http_client.payload_parser.insert_pagination_object_author(self.original_payload)
@@ -313,17 +311,13 @@ class TweetPagination(Pagination):
         if not res:
             raise NoPageAvailable()
 
-        previous_content = self.content
+        previous_first_id = self._payload[0]["id"]
         self._current_page_number += 1
-        self.original_payload = res
-        self.payload = self.content
-        self._meta = self.original_payload.get("meta")
-        self._next_token = self._meta.get("next_token")
-        self._previous_token = self._meta.get("previous_token")
-        self._count = 0
+        self._apply_response(res)
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {tweet.id: tweet for tweet in self.content}
+        if previous_first_id != self._payload[0]["id"]:
+            new_content = self.content
+            self.pages_cache[self._current_page_number] = dict(zip(map(_get_id, new_content), new_content))
 
     def previous_page(self) -> None:
         """Change `content` property to the previous page's contents..
@@ -350,17 +344,13 @@ class TweetPagination(Pagination):
         if not res:
             raise NoPageAvailable()
 
-        previous_content = self.content
+        previous_first_id = self._payload[0]["id"]
         self._current_page_number -= 1
-        self.original_payload = res
-        self.payload = self.content
-        self._meta = self.original_payload.get("meta")
-        self._next_token = self._meta.get("next_token")
-        self._previous_token = self._meta.get("previous_token")
-        self._count = 0
+        self._apply_response(res)
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {tweet.id: tweet for tweet in self.content}
+        if previous_first_id != self._payload[0]["id"]:
+            new_content = self.content
+            self.pages_cache[self._current_page_number] = dict(zip(map(_get_id, new_content), new_content))
 
 
 class ListPagination(Pagination):
@@ -378,13 +368,7 @@ class ListPagination(Pagination):
 
         super().__init__(data, item_type=TwitterList, **kwargs)
 
-    @property
-    def content(self) -> list:
-        """:class:`list`: Returns a list of objects from the current page's content.
-
-        .. versionadded:: 1.5.0
-        """
-
+    def _parse_content(self) -> list:
         return [
             self.item_type(data, http_client=self.http_client)
             for data in self.http_client.payload_parser.insert_pagination_object_author(self.original_payload)
@@ -415,19 +399,13 @@ class ListPagination(Pagination):
         if not res:
             raise NoPageAvailable()
 
-        previous_content = self.content
+        previous_first_id = self._payload[0]["id"]
         self._current_page_number += 1
-        self.original_payload = res
-        self.payload = self.content
-        self._meta = self.original_payload.get("meta")
-        self._next_token = self._meta.get("next_token")
-        self._previous_token = self._meta.get("previous_token")
-        self._count = 0
+        self._apply_response(res)
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {
-                _TwitterList.id: _TwitterList for _TwitterList in self.content
-            }
+        if previous_first_id != self._payload[0]["id"]:
+            new_content = self.content
+            self.pages_cache[self._current_page_number] = dict(zip(map(_get_id, new_content), new_content))
 
     def previous_page(self) -> None:
         """Change `content` property to the previous page's contents..
@@ -454,19 +432,13 @@ class ListPagination(Pagination):
         if not res:
             raise NoPageAvailable()
 
-        previous_content = self.content
+        previous_first_id = self._payload[0]["id"]
         self._current_page_number -= 1
-        self.original_payload = res
-        self.payload = self.content
-        self._meta = self.original_payload.get("meta")
-        self._next_token = self._meta.get("next_token")
-        self._previous_token = self._meta.get("previous_token")
-        self._count = 0
+        self._apply_response(res)
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {
-                _TwitterList.id: _TwitterList for _TwitterList in self.content
-            }
+        if previous_first_id != self._payload[0]["id"]:
+            new_content = self.content
+            self.pages_cache[self._current_page_number] = dict(zip(map(_get_id, new_content), new_content))
 
 
 class MessagePagination(Pagination):
@@ -510,17 +482,13 @@ class MessagePagination(Pagination):
         if not res:
             raise NoPageAvailable()
 
-        previous_content = self.content
+        previous_first_id = self._payload[0]["id"]
         self._current_page_number += 1
-        self.original_payload = self.http_client.payload_parser.parse_message_to_pagination_data(res)
-        self.payload = self.content
-        self._meta = self.original_payload.get("meta")
-        self._next_token = self._meta.get("next_token")
-        self._previous_token = self._meta.get("previous_token")
-        self._count = 0
+        self._apply_response(self.http_client.payload_parser.parse_message_to_pagination_data(res))
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {message.id: message for message in self.content}
+        if previous_first_id != self._payload[0]["id"]:
+            new_content = self.content
+            self.pages_cache[self._current_page_number] = dict(zip(map(_get_id, new_content), new_content))
 
     def previous_page(self) -> None:
         """Change `content` property to the previous page's contents..
@@ -547,14 +515,10 @@ class MessagePagination(Pagination):
         if not res:
             raise NoPageAvailable()
 
-        previous_content = self.content
+        previous_first_id = self._payload[0]["id"]
         self._current_page_number -= 1
-        self.original_payload = self.http_client.payload_parser.parse_message_to_pagination_data(res)
-        self.payload = self.content
-        self._meta = self.original_payload.get("meta")
-        self._next_token = self._meta.get("next_token")
-        self._previous_token = self._meta.get("previous_token")
-        self._count = 0
+        self._apply_response(self.http_client.payload_parser.parse_message_to_pagination_data(res))
 
-        if not previous_content[0] == self.content[0]:
-            self.pages_cache[len(self.pages_cache) + 1] = {message.id: message for message in self.content}
+        if previous_first_id != self._payload[0]["id"]:
+            new_content = self.content
+            self.pages_cache[self._current_page_number] = dict(zip(map(_get_id, new_content), new_content))
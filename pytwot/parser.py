@@ -51,6 +51,15 @@ if TYPE_CHECKING:
 
 __all__ = ("PayloadParser", "EventParser")
 
+_USER_ACTION_EVENTS = {
+    "follow": ("user_follow", UserFollowActionEvent),
+    "unfollow": ("user_unfollow", UserUnfollowActionEvent),
+    "block": ("user_block", UserBlockActionEvent),
+    "unblock": ("user_unblock", UserUnblockActionEvent),
+    "mute": ("user_mute", UserMuteActionEvent),
+    "unmute": ("user_unmute", UserUnmuteActionEvent),
+}
+
 
 class PayloadParser:
     __slots__ = "http_client"
@@ -59,40 +68,43 @@ class PayloadParser:
         self.http_client = http_client
 
     def parse_user_payload(self, payload: Payload) -> ResponsePayload:
-        copy = payload.copy()
-        copy["public_metrics"] = {
-            "followers_count": copy.get("followers_count"),
-            "following_count": copy.get("friends_count"),
-            "tweet_count": copy.get("statuses_count"),
-            "listed_count": 0,
-        }
-        keys = copy.keys()
-        if "created_timestamp" in keys:
-            copy["created_at"] = copy.get("created_timestamp")
-        if "screen_name" in keys:
-            copy["username"] = copy.get("screen_name")
-
-        if "profile_image_url_https" in keys:
-            copy["profile_image_url"] = copy.get("profile_image_url_https")
-        return copy
+        return self._parse_user_payload_inplace(payload.copy())
+
+    def _parse_user_payload_inplace(self, payload: Payload) -> ResponsePayload:
+        # Same as parse_user_payload but mutates the given payload, for callers that own it.
+        if "followers_count" in payload:
+            get = payload.get
+            payload["public_metrics"] = {
+                "followers_count": get("followers_count"),
+                "following_count": get("friends_count"),
+                "tweet_count": get("statuses_count"),
+                "listed_count": 0,
+            }
+        if "created_timestamp" in payload:
+            payload["created_at"] = payload["created_timestamp"]
+        if "screen_name" in payload:
+            payload["username"] = payload["screen_name"]
+
+        if "profile_image_url_https" in payload:
+            payload["profile_image_url"] = payload["profile_image_url_https"]
+        return payload
 
     def parse_tweet_payload(self, payload: Payload) -> ResponsePayload:
+        get = payload.get
         payload["public_metrics"] = {
-            "quote_count": payload.get("quote_count"),
-            "reply_count": payload.get("reply_count"),
-            "retweet_count": payload.get("retweet_count"),
-            "like_count": payload.get("favorite_count"),
+            "quote_count": get("quote_count"),
+            "reply_count": get("reply_count"),
+            "retweet_count": get("retweet_count"),
+            "like_count": get("favorite_count"),
         }
-        payload["includes"] = {}
-        payload["includes"]["mentions"] = [
-            user.get("screen_name") for user in payload.get("entities").get("user_mentions")
-        ]
+        includes = payload["includes"] = {}
+        includes["mentions"] = [user.get("screen_name") for user in payload["entities"]["user_mentions"]]
 
-        if "timestamp_ms" in payload.keys():
-            payload["timestamp"] = payload.get("timestamp_ms")
+        if "timestamp_ms" in payload:
+            payload["timestamp"] = payload["timestamp_ms"]
 
-        if "user" in payload.keys():
-            payload["includes"]["users"] = [self.parse_user_payload(payload.get("user"))]
+        if "user" in payload:
+            includes["users"] = [self.parse_user_payload(payload["user"])]
 
         return payload
 
@@ -122,13 +134,8 @@ class PayloadParser:
         return payload
 
     def insert_pagination_object_author(self, payload: Payload) -> list:
-        fulldata = []
-        for index, data in enumerate(payload["data"]):
-            fulldata.append({})
-            fulldata[index]["data"] = data
-            fulldata[index]["includes"] = {}
-            fulldata[index]["includes"]["users"] = [payload.get("includes", {}).get("users", [None])[0]]
-        return fulldata
+        author = payload.get("includes", {}).get("users", [None])[0]
+        return [{"data": data, "includes": {"users": [author]}} for data in payload["data"]]
 
     def parse_message_to_pagination_data(self, data: Payload) -> ResponsePayload:
         data["meta"] = {"next_token": data.get("next_cursor"), "previous_token": data.get("previous_cursor")}
@@ -141,29 +148,23 @@ class PayloadParser:
         else:
             events = data["data"]
 
-        ids = []
+        ids = set()
         for event_data in events:
             message_create = event_data["message_create"]
-            ids.append(message_create["target"]["recipient_id"])
-            ids.append(message_create["sender_id"])
-        users = self.http_client.fetch_users(ids)
+            ids.add(int(message_create["target"]["recipient_id"]))
+            ids.add(int(message_create["sender_id"]))
+        users_by_id = {user.id: user for user in self.http_client.fetch_users(list(ids))}
 
+        apps_by_id = {int(app["id"]): ApplicationInfo(**app) for app in (data.get("apps") or {}).values()}
         for event_data in events:
             message_create = event_data["message_create"]
-            for user in users:
-                if user.id == int(message_create["target"]["recipient_id"]):
-                    message_create["target"]["recipient"] = user
+            target = message_create["target"]
+            target["recipient"] = users_by_id.get(int(target["recipient_id"]))
+            target["sender"] = users_by_id.get(int(message_create["sender_id"]))
 
-                if user.id == int(message_create["sender_id"]):
-                    message_create["target"]["sender"] = user
-
-            if data.get("apps"):
-                for app in [ApplicationInfo(**data) for data in list(data.get("apps").values())]:
-                    if app.id == int(message_create.get("source_app_id", 0)):
-                        message_create["target"]["source_application"] = app
-
-                    if app.id == int(message_create.get("source_app_id", 0)):
-                        message_create["target"]["source_application"] = app
+            app = apps_by_id.get(int(message_create.get("source_app_id", 0)))
+            if app is not None:
+                target["source_application"] = app
         return data
 
     def parse_embed_data(self, payload: Payload) -> ResponsePayload:
@@ -173,10 +174,7 @@ class PayloadParser:
         return payload
 
     def parse_metric_data(self, payload: Payload) -> Payload:
-        d = {}
-        for k, v in payload.items():
-            d[k] = convert(v, int)
-        return d
+        return {k: convert(v, int) for k, v in payload.items()}
 
 
 class EventParser:
@@ -191,97 +189,85 @@ class EventParser:
             self.client_id = int(self.http_client.fetch_me().id)
 
     def parse_direct_message_create(self, direct_message_payload: Payload) -> None:
-        event_payload = {"event": direct_message_payload.get("direct_message_events")[0]}
-        users = direct_message_payload.get("users")
-
-        message_create = event_payload["event"].get("message_create")
-        recipient_id = message_create.get("target").get("recipient_id")
-        sender_id = message_create.get("sender_id")
-
-        recipient = User(
-            self.payload_parser.parse_user_payload(users.get(recipient_id)),
-            http_client=self.http_client,
-        )
-        sender = User(
-            self.payload_parser.parse_user_payload(users.get(sender_id)),
-            http_client=self.http_client,
-        )
+        event_payload = {"event": direct_message_payload["direct_message_events"][0]}
+        users = direct_message_payload["users"]
+
+        message_create = event_payload["event"]["message_create"]
+        target = message_create["target"]
+
+        http_client = self.http_client
+        client_id = self.client_id
+        parse_user = self.payload_parser._parse_user_payload_inplace
+        recipient = User(parse_user(users[target["recipient_id"]]), http_client=http_client)
+        sender = User(parse_user(users[message_create["sender_id"]]), http_client=http_client)
         application_info = direct_message_payload.get("apps")
         if application_info:
-            source_app_id = list(application_info.keys())[0]
-            source_app = ApplicationInfo(**application_info.get(source_app_id))
+            source_app_id = next(iter(application_info))
+            source_app = ApplicationInfo(**application_info[source_app_id])
 
         else:
             source_app = None
 
-        event_payload["event"]["message_create"]["target"]["recipient"] = recipient
-        event_payload["event"]["message_create"]["target"]["sender"] = sender
-        event_payload["event"]["message_create"]["target"]["source_application"] = source_app
+        target["recipient"] = recipient
+        target["sender"] = sender
+        target["source_application"] = source_app
 
-        direct_message = DirectMessage(event_payload, http_client=self.http_client)
+        direct_message = DirectMessage(event_payload, http_client=http_client)
 
-        if recipient.id != self.client_id:
-            self.http_client.user_cache[recipient.id] = recipient
+        if recipient.id != client_id:
+            http_client.user_cache[recipient.id] = recipient
 
-        if sender.id != self.client_id:
-            self.http_client.user_cache[sender.id] = sender
+        if sender.id != client_id:
+            http_client.user_cache[sender.id] = sender
 
-        self.http_client.message_cache[direct_message.id] = direct_message
-        self.http_client.dispatch("direct_message", direct_message)
+        http_client.message_cache[direct_message.id] = direct_message
+        http_client.dispatch("direct_message", direct_message)
 
     def parse_direct_message_typing(self, typing_payload: Payload) -> None:
-        event_payload = typing_payload.get("direct_message_indicate_typing_events")[0]
-        users = typing_payload.get("users")
+        event_payload = typing_payload["direct_message_indicate_typing_events"][0]
+        users = typing_payload["users"]
+        target = event_payload["target"]
 
-        recipient_id = event_payload.get("target").get("recipient_id")
-        sender_id = event_payload.get("sender_id")
-        recipient = User(
-            self.payload_parser.parse_user_payload(users.get(recipient_id)),
-            http_client=self.http_client,
-        )
-        sender = User(
-            self.payload_parser.parse_user_payload(users.get(sender_id)),
-            http_client=self.http_client,
-        )
+        http_client = self.http_client
+        client_id = self.client_id
+        parse_user = self.payload_parser._parse_user_payload_inplace
+        recipient = User(parse_user(users[target["recipient_id"]]), http_client=http_client)
+        sender = User(parse_user(users[event_payload["sender_id"]]), http_client=http_client)
 
-        event_payload["target"]["recipient"] = recipient
-        event_payload["target"]["sender"] = sender
+        target["recipient"] = recipient
+        target["sender"] = sender
 
-        if recipient.id != self.client_id:
-            self.http_client.user_cache[recipient.id] = recipient
+        if recipient.id != client_id:
+            http_client.user_cache[recipient.id] = recipient
 
-        if sender.id != self.client_id:
-            self.http_client.user_cache[sender.id] = sender
+        if sender.id != client_id:
+            http_client.user_cache[sender.id] = sender
 
-        payload = DirectMessageTypingEvent(event_payload, http_client=self.http_client)
-        self.http_client.dispatch("typing", payload)
+        payload = DirectMessageTypingEvent(typing_payload, http_client=http_client)
+        http_client.dispatch("typing", payload)
 
     def parse_direct_message_read(self, read_payload: Payload) -> None:
-        event_payload = read_payload.get("direct_message_mark_read_events")[0]
-        users = read_payload.get("users")
+        event_payload = read_payload["direct_message_mark_read_events"][0]
+        users = read_payload["users"]
+        target = event_payload["target"]
 
-        recipient_id = event_payload.get("target").get("recipient_id")
-        sender_id = event_payload.get("sender_id")
-        recipient = User(
-            self.payload_parser.parse_user_payload(users.get(recipient_id)),
-            http_client=self.http_client,
-        )
-        sender = User(
-            self.payload_parser.parse_user_payload(users.get(sender_id)),
-            http_client=self.http_client,
-        )
+        http_client = self.http_client
+        client_id = self.client_id
+        parse_user = self.payload_parser._parse_user_payload_inplace
+        recipient = User(parse_user(users[target["recipient_id"]]), http_client=http_client)
+        sender = User(parse_user(users[event_payload["sender_id"]]), http_client=http_client)
 
-        event_payload["target"]["recipient"] = recipient
-        event_payload["target"]["sender"] = sender
+        target["recipient"] = recipient
+        target["sender"] = sender
 
-        if recipient.id != self.client_id:
-            self.http_client.user_cache[recipient.id] = recipient
+        if recipient.id != client_id:
+            http_client.user_cache[recipient.id] = recipient
 
-        if sender.id != self.client_id:
-            self.http_client.user_cache[sender.id] = sender
+        if sender.id != client_id:
+            http_client.user_cache[sender.id] = sender
 
-        payload = DirectMessageReadEvent(event_payload, http_client=self.http_client)
-        self.http_client.dispatch("read", payload)
+        payload = DirectMessageReadEvent(read_payload, http_client=http_client)
+        http_client.dispatch("read", payload)
 
     def parse_user_revoke(self, action_payload: Payload) -> None:
         action = UserRevokeEvent(action_payload)
@@ -291,47 +277,25 @@ class EventParser:
         action_payload = action_payload.copy()
         event_payload = action_payload.get(action_type)[0]
         action_type = event_payload.get("type")
-        target = User(
-            self.payload_parser.parse_user_payload(event_payload.get("target")),
-            http_client=self.http_client,
-        )
-        source = User(
-            self.payload_parser.parse_user_payload(event_payload.get("source")),
-            http_client=self.http_client,
-        )
+        http_client = self.http_client
+        parse_user = self.payload_parser._parse_user_payload_inplace
+        target = User(parse_user(event_payload.get("target")), http_client=http_client)
+        source = User(parse_user(event_payload.get("source")), http_client=http_client)
 
         event_payload["target"] = target
         event_payload["source"] = source
 
         if target.id != self.client_id:
-            self.http_client.user_cache[target.id] = target
+            http_client.user_cache[target.id] = target
 
         if source.id != self.client_id:
-            self.http_client.user_cache[source.id] = source
+            http_client.user_cache[source.id] = source
 
-        if action_type == "follow":
-            action = UserFollowActionEvent(action_payload)
-            self.http_client.dispatch("user_follow", action)
-
-        elif action_type == "unfollow":
-            action = UserUnfollowActionEvent(action_payload)
-            self.http_client.dispatch("user_unfollow", action)
-
-        elif action_type == "block":
-            action = UserBlockActionEvent(action_payload)
-            self.http_client.dispatch("user_block", action)
-
-        elif action_type == "unblock":
-            action = UserUnblockActionEvent(action_payload)
-            self.http_client.dispatch("user_unblock", action)
-
-        elif action_type == "mute":
-            action = UserMuteActionEvent(action_payload)
-            self.http_client.dispatch("user_mute", action)
-
-        elif action_type == "unmute":
-            action = UserUnmuteActionEvent(action_payload)
-            self.http_client.dispatch("user_unmute", action)
+        try:
+            event_name, event_cls = _USER_ACTION_EVENTS[action_type]
+        except KeyError:
+            return
+        http_client.dispatch(event_name, event_cls(action_payload))
 
     def parse_tweet_create(self, tweet_payload: Payload) -> None:
         tweet_payload = self.payload_parser.parse_tweet_payload(tweet_payload.get("tweet_create_events")[0])
@@ -340,31 +304,28 @@ class EventParser:
         self.http_client.dispatch("tweet_create", tweet)
 
     def parse_tweet_delete(self, tweet_payload: Payload) -> None:
-        event_payload = tweet_payload.get("tweet_delete_events")[0]
-        tweet_id = event_payload.get("status").get("id")
-        tweet = self.http_client.tweet_cache.get(int(tweet_id))
+        event_payload = tweet_payload["tweet_delete_events"][0]
+        tweet_id = event_payload["status"]["id"]
+        http_client = self.http_client
+        tweet = http_client.tweet_cache.pop(int(tweet_id), None)
         if not tweet:
             message = Message(None, tweet_id, 1)
-            return self.http_client.dispatch("tweet_delete", message)
+            return http_client.dispatch("tweet_delete", message)
 
-        try:
-            self.http_client.tweet_cache.pop(int(tweet_id))
-        except KeyError:
-            pass
-        finally:
-            tweet.deleted_timestamp = int(event_payload.get("timestamp_ms"))
-            self.http_client.dispatch("tweet_delete", tweet)
+        tweet.deleted_timestamp = int(event_payload["timestamp_ms"])
+        http_client.dispatch("tweet_delete", tweet)
 
     def parse_favorite_tweet(self, favorite_payload: Payload) -> None:
         action_payload = favorite_payload.copy()
         event_payload = favorite_payload.get("favorite_events")[0]
         tweet = Tweet(self.payload_parser.parse_tweet_payload(event_payload.get("favorited_status")))
-        user = User(self.payload_parser.parse_user_payload(event_payload.get("user")))
+        user = User(self.payload_parser._parse_user_payload_inplace(event_payload.get("user")))
         event_payload["tweet"] = tweet
         event_payload["liker"] = user
 
+        http_client = self.http_client
         if user.id != self.client_id:
-            self.http_client.user_cache[user.id] = user
+            http_client.user_cache[user.id] = user
 
         action = TweetFavoriteActionEvent(action_payload)
-        self.http_client.dispatch("tweet_favorite", action)
+        http_client.dispatch("tweet_favorite", action)
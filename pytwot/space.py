@@ -36,6 +36,24 @@ from .utils import time_parse_todt
 
 __all__ = ("Space",)
 
+# Query parameters for Space.fetch_tweets and Space.fetch_buyers, built once since they never change.
+_FETCH_TWEETS_PARAMS = {
+    "expansions": TWEET_EXPANSION,
+    "tweet.fields": TWEET_FIELD,
+    "user.fields": USER_FIELD,
+    "media.fields": MEDIA_FIELD,
+    "place.fields": PLACE_FIELD,
+    "poll.fields": POLL_FIELD,
+}
+_FETCH_BUYERS_PARAMS = {
+    "expansions": TWEET_EXPANSION,
+    "user.fields": USER_FIELD,
+    "media.fields": MEDIA_FIELD,
+    "place.fields": PLACE_FIELD,
+    "poll.fields": POLL_FIELD,
+    "tweet.fields": TWEET_FIELD,
+}
+
 
 class Space(Comparable):
     """Represents a twitter space.
@@ -43,13 +61,26 @@ class Space(Comparable):
     .. versionadded:: 1.3.5
     """
 
-    __slots__ = ("__original_payload", "_payload", "http_client", "_include")
+    __slots__ = (
+        "__original_payload",
+        "_payload",
+        "http_client",
+        "_includes",
+        "_created_at",
+        "_started_at",
+        "_updated_at",
+        "_topics",
+    )
 
     def __init__(self, data: Dict[str, Any], http_client: object):
         self.__original_payload = data
         self._includes = self.__original_payload.get("includes")
         self._payload = self.__original_payload.get("data") or self.__original_payload
         self.http_client = http_client
+        self._created_at = None
+        self._started_at = None
+        self._updated_at = None
+        self._topics = None
         super().__init__(self.id)
 
     def __repr__(self) -> str:
@@ -85,7 +116,7 @@ class Space(Comparable):
 
         .. versionadded:: 1.3.5
         """
-        return SpaceState(self.raw_state)
+        return SpaceState(self._payload.get("state"))
 
     @property
     def lang(self) -> str:
@@ -101,7 +132,9 @@ class Space(Comparable):
 
         .. versionadded:: 1.3.5
         """
-        return time_parse_todt(self._payload.get("created_at"))
+        if self._created_at is None:
+            self._created_at = time_parse_todt(self._payload.get("created_at"))
+        return self._created_at
 
     @property
     def started_at(self) -> Optional[datetime.datetime]:
@@ -109,7 +142,11 @@ class Space(Comparable):
 
         .. versionadded:: 1.3.5
         """
-        return time_parse_todt(self._payload.get("started_at")) if self._payload.get("started_at") else None
+        if self._started_at is None:
+            started_at = self._payload.get("started_at")
+            if started_at:
+                self._started_at = time_parse_todt(started_at)
+        return self._started_at
 
     @property
     def updated_at(self) -> Optional[datetime.datetime]:
@@ -117,7 +154,9 @@ class Space(Comparable):
 
         .. versionadded:: 1.3.5
         """
-        return time_parse_todt(self._payload.get("updated_at"))
+        if self._updated_at is None:
+            self._updated_at = time_parse_todt(self._payload.get("updated_at"))
+        return self._updated_at
 
     @property
     def ticketed(self) -> bool:
@@ -139,9 +178,9 @@ class Space(Comparable):
 
         .. versionadded:: 1.5.0
         """
-        if self._includes.get("topics"):
-            return [Topic(**data) for data in self._includes["topics"]]
-        return None
+        if self._topics is None and self._includes.get("topics"):
+            self._topics = [Topic(**data) for data in self._includes["topics"]]
+        return self._topics
 
     @property
     def participant_count(self) -> int:
@@ -231,14 +270,7 @@ class Space(Comparable):
             "GET",
             "2",
             f"/spaces/{self.id}/tweets",
-            params={
-                "expansions": TWEET_EXPANSION,
-                "tweet.fields": TWEET_FIELD,
-                "user.fields": USER_FIELD,
-                "media.fields": MEDIA_FIELD,
-                "place.fields": PLACE_FIELD,
-                "poll.fields": POLL_FIELD,
-            },
+            params=_FETCH_TWEETS_PARAMS,
         )
 
         if not res or not res.get("data"):
@@ -261,14 +293,7 @@ class Space(Comparable):
             "GET",
             "2",
             f"/spaces/{self.id}/buyers",
-            params={
-                "expansions": TWEET_EXPANSION,
-                "user.fields": USER_FIELD,
-                "media.fields": MEDIA_FIELD,
-                "place.fields": PLACE_FIELD,
-                "poll.fields": POLL_FIELD,
-                "tweet.fields": TWEET_FIELD,
-            },
+            params=_FETCH_BUYERS_PARAMS,
         )
         if not res:
             return []
@@ -93,6 +93,7 @@ class Tweet(Message):
         "_non_public_metrics",
         "_organic_metrics",
         "_promoted_metrics",
+        "_poll",
     )
 
     def __init__(
@@ -109,6 +110,7 @@ class Tweet(Message):
         self._entities = self._payload.get("entities")
         self.http_client = http_client
         self.deleted_timestamp = deleted_timestamp
+        self._poll = None
         self._public_metrics = PublicTweetMetrics(
             **self._payload.get("public_metrics", None) or self.__original_payload.get("public_metrics")
         )
@@ -279,19 +281,18 @@ class Tweet(Message):
 
         .. versionadded:: 1.1.0
         """
-        if self._includes:
-            if self._includes.get("polls"):
-                data = self._includes.get("polls")[0]
-                poll = Poll(
-                    duration=data.get("duration_minutes"),
-                    id=data.get("id"),
-                    voting_status=data.get("voting_status"),
-                    end_date=data.get("end_datetime"),
-                )
-                for option in data.get("options"):
-                    poll.add_option(**option)
-                return poll
-        return None
+        if self._poll is None and self._includes and self._includes.get("polls"):
+            data = self._includes["polls"][0]
+            poll = Poll(
+                duration=data.get("duration_minutes"),
+                id=data.get("id"),
+                voting_status=data.get("voting_status"),
+                end_date=data.get("end_datetime"),
+            )
+            for option in data.get("options"):
+                poll.add_option(**option)
+            self._poll = poll
+        return self._poll
 
     @property
     def media(self) -> Optional[List[Media]]:
@@ -27,13 +27,26 @@ SOFTWARE.
 from __future__ import annotations
 
 import datetime
+import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Optional
-
-from dateutil import parser
+from urllib.parse import quote
 
 if TYPE_CHECKING:
     from .type import ID
 
+# Mimetypes keyed by the 4 bytes found at offset 6 of the file's header.
+_MIMETYPE_SIGNATURES = {
+    b"\x1a\n\x00\x00": "image/png",
+    b"JFIF": "image/jpeg",
+    b"ypis": "video/mp4",
+}
+
+_USER_ACTIONS = frozenset(("follow", "dm"))
+_TWEET_ACTIONS = frozenset(("retweet", "like", "reply"))
+
+_DATETIME_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})[ T](\d{2}):(\d{2}):(\d{2})")
+
 
 def convert(o: object, annotations: Any) -> object:
     try:
@@ -43,14 +56,9 @@ def convert(o: object, annotations: Any) -> object:
 
 
 def guess_mimetype(byts: bytes) -> str:
-    if byts[6:10] == b"\x1a\n\x00\x00":
-        return "image/png"
-
-    elif byts[6:10] == b"JFIF":
-        return "image/jpeg"
-
-    elif byts[6:10] == b"ypis":
-        return "video/mp4"
+    mimetype = _MIMETYPE_SIGNATURES.get(bytes(byts[6:10]))
+    if mimetype:
+        return mimetype
 
     elif byts.startswith((b"\x47\x49\x46\x38\x37\x61", b"\x47\x49\x46\x38\x39\x61")):
         return "image/gif"
@@ -59,6 +67,26 @@ def guess_mimetype(byts: bytes) -> str:
         return "text/plain"
 
 
+@lru_cache(maxsize=1024)
+def _parse_datetime(date: str) -> datetime.datetime:
+    try:
+        dt = datetime.datetime.fromisoformat(date.replace("Z", "+00:00"))
+    except ValueError:
+        match = _DATETIME_RE.match(date)
+        if match:
+            return datetime.datetime(*map(int, match.groups()))
+
+        try:
+            # Twitter's v1.1 format, e.g. "Wed Oct 10 20:19:24 +0000 2018".
+            dt = datetime.datetime.strptime(date, "%a %b %d %H:%M:%S %z %Y")
+        except ValueError:
+            from dateutil import parser
+
+            dt = parser.parse(date)
+
+    return dt.replace(microsecond=0, tzinfo=None)
+
+
 def time_parse_todt(date: Optional[Any]) -> datetime.datetime:
     """Parse time return from twitter to datetime object!
 
@@ -69,18 +97,9 @@ def time_parse_todt(date: Optional[Any]) -> datetime.datetime:
 
     .. versionadded: 1.1.3
     """
-    date = str(parser.parse(date))
-    y, mo, d = date.split("-")
-    h, mi, s = date.split(" ")[1].split("+")[0].split(":")
-
-    return datetime.datetime(
-        year=int(y),
-        month=int(mo),
-        day=int(d.split(" ")[0]),
-        hour=int(h),
-        minute=int(mi),
-        second=int(s),
-    )
+    if not isinstance(date, str):
+        date = str(date)
+    return _parse_datetime(date)
 
 
 def compose_tweet(text: Optional[str] = None) -> str:
@@ -100,8 +119,8 @@ def compose_tweet(text: Optional[str] = None) -> str:
     .. versionadded: 1.3.5
     """
     if text:
-        text = text.replace(" ", "%20")
-    return "https://twitter.com/intent/tweet" if not text else f"https://twitter.com/intent/tweet" + f"?text={text}"
+        return f"https://twitter.com/intent/tweet?text={quote(text, safe='')}"
+    return "https://twitter.com/intent/tweet"
 
 
 def compose_user_action(user_id: str, action: str, text: str = None) -> str:
@@ -121,20 +140,22 @@ def compose_user_action(user_id: str, action: str, text: str = None) -> str:
     ---------
     :class:`str`
 
+    Raises
+    --------
+    TypeError
+        The action is not "follow" or "dm".
+
 
     .. versionadded: 1.3.5
     """
-    if action.lower() not in ("follow", "dm"):
-        return TypeError("Action must be either 'follow' or 'dm'")
+    action = action.lower()
+    if action not in _USER_ACTIONS:
+        raise TypeError("Action must be either 'follow' or 'dm'")
+    if action == "follow":
+        return f"https://twitter.com/intent/user?user_id={user_id}"
     if text:
-        text = text.replace(" ", "%20")
-    return (
-        f"https://twitter.com/intent/user?user_id={user_id}"
-        if action.lower() == "follow"
-        else f"https://twitter.com/messages/compose?recipient_id={user_id}" + f"?text={text}"
-        if text
-        else f"https://twitter.com/messages/compose?recipient_id={user_id}"
-    )
+        return f"https://twitter.com/messages/compose?recipient_id={user_id}&text={quote(text, safe='')}"
+    return f"https://twitter.com/messages/compose?recipient_id={user_id}"
 
 
 def compose_tweet_action(tweet_id: ID, action: str = None) -> str:
@@ -151,11 +172,17 @@ def compose_tweet_action(tweet_id: ID, action: str = None) -> str:
     ---------
     :class:`str`
 
+    Raises
+    --------
+    TypeError
+        The action is not "retweet", "like", or "reply".
+
 
     .. versionadded: 1.3.5
     """
-    if action.lower() not in ("retweet", "like", "reply"):
-        return TypeError("Action must be either 'retweet', 'like', or 'reply'")
+    action = action.lower()
+    if action not in _TWEET_ACTIONS:
+        raise TypeError("Action must be either 'retweet', 'like', or 'reply'")
     return (
         f"https://twitter.com/intent/{action}?tweet_id={tweet_id}"
         if action != "reply"